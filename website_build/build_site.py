@@ -18,7 +18,13 @@ from filename_information import git_event, git_SHA
 from git_tree import branch_contents, file_contents
 from json_information import read_additional_stats, read_profiling_json
 from json_information import JSON_COLUMNS, STATS_COLUMNS
-from stat_plots import make_stats_plots, markdown_for_run_plots
+from stat_plots import (
+    DERIVED_COLUMNS,
+    compute_derived_stats,
+    make_stats_plots,
+    markdown_for_run_plots,
+    markdown_for_run_stats_table,
+)
 from utils import clean_build_directory, create_dump_folder, write_md_link
 
 TABLE_EXTRA_COLUMNS = [
@@ -27,9 +33,15 @@ TABLE_EXTRA_COLUMNS = [
     "Commit",
     "Triggered by",
 ]
-DF_COLS = set(TABLE_EXTRA_COLUMNS) | set(JSON_COLUMNS) | set(STATS_COLUMNS)
+DF_COLS = (
+    set(TABLE_EXTRA_COLUMNS)
+    | set(JSON_COLUMNS)
+    | set(STATS_COLUMNS)
+    | set(DERIVED_COLUMNS)
+)
 MARKDOWN_REPLACEMENT_STRING = "<<<MATCH_PATTERN_FOR_MARKDOWN_TABLE_INSERT>>>"
 RUN_PLOTS_REPLACEMENT_STRING = "<<<MATCH_PATTERN_FOR_RUN_STATS_PLOTS>>>"
+RUN_TABLE_REPLACEMENT_STRING = "<<<MATCH_PATTERN_FOR_RUN_STATS_TABLE>>>"
 DESCRIPTION = (
     "Build the website deployment for the profiling results, "
     "placing the resulting files in the build directory."
@@ -189,7 +201,13 @@ class WebsiteBuilder:
         """
         Read any saved stats (if they exist) for each pyis session and populate
         the columns of the DataFrame with this information.
+
+        Stats files are expected to sit alongside their pyis session on the source branch,
+        sharing the same name but carrying the stats_file_extension.
         """
+        available_stats_files = set(
+            branch_contents(self.source_branch, f"*.{stats_file_extension}")
+        )
         for index in self.df.index:
             # Fetch pyis file if it doesn't already exist
             pyis_file = Path(self.df["pyis"][index])
@@ -208,46 +226,50 @@ class WebsiteBuilder:
                     pyis_file.parent / f"{pyis_file.stem}.{stats_file_extension}"
                 )
                 dump_stats_file = self.dump_folder / stats_file
-                try:
-                    file_contents(
-                        self.source_branch,
-                        stats_file,
-                        dump_file,
-                    )
-                except FileNotFoundError as e:
+                if stats_file not in available_stats_files:
                     # File does not exist on the target branch, cannot write stats for this entry
                     print(
                         f"Skipping {pyis_file}: expected stats file ({stats_file}) not found"
                     )
                     continue
+                file_contents(
+                    self.source_branch,
+                    stats_file,
+                    dump_stats_file,
+                )
                 # Record additional stats as recorded in the stats file
                 self.df.loc[index, STATS_COLUMNS] = read_additional_stats(
                     dump_stats_file
                 )
 
         # All additional stats have been pulled and added to the DataFrame
+        # Compute the statistics that are derived from those recorded
+        compute_derived_stats(self.df)
         # Sort the DataFrame by start_time
         self.df.sort_values("Start Time", ascending=True, inplace=True)
 
     def write_run_stats_page(self) -> None:
-        """ """
+        """
+        Create the plots of the run statistics, and the markdown source for the
+        run statistics page that displays them alongside a per-session table of statistics.
+        """
         self.plots = make_stats_plots(self.df, self.build_dir / "plots")
 
         # Write markdown to include plots in site
         plot_markdown = markdown_for_run_plots(self.plots, self.build_dir)
+        # Write markdown for the per-session statistics table
+        table_markdown = markdown_for_run_stats_table(self.df)
 
         # Write the file
         run_stats_index = self.build_dir / "run_statistics.md"
         with open(RUN_STATS_LOOKUP_TEMPLATE, "r") as f:
             lookup_page_contents = f.read()
-        template_contents = lookup_page_contents.split(RUN_PLOTS_REPLACEMENT_STRING)
+        lookup_page_contents = lookup_page_contents.replace(
+            RUN_PLOTS_REPLACEMENT_STRING, plot_markdown
+        ).replace(RUN_TABLE_REPLACEMENT_STRING, table_markdown)
         # Write processed lookup page to the build directory
         with open(run_stats_index, "w") as f:
-            f.write(template_contents[0])
-        with open(run_stats_index, "a") as f:
-            f.write(plot_markdown)
-        with open(run_stats_index, "a") as f:
-            f.write(template_contents[1])
+            f.write(lookup_page_contents)
 
     def build(self) -> None:
         """
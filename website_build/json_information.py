@@ -1,13 +1,40 @@
 from datetime import datetime
 import json
+import math
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Tuple
 
 JSON_COLUMNS = [
     "Start Time",
     "duration (s)",
 ]
-STATS_COLUMNS = []
+STATS_COLUMNS = [
+    "peak RSS (MB)",
+    "CPU time (s)",
+    "samples",
+    "CPU model",
+    "CPU cores",
+    "calibration score",
+]
+# Keys in the stats.json files from which each of the STATS_COLUMNS are read.
+# The calibration score is the speed of the runner relative to a reference machine,
+# so a score of 2.0 indicates the runner completed the calibration workload twice as fast.
+STATS_JSON_KEYS = {
+    "peak RSS (MB)": "peak_rss_mb",
+    "CPU time (s)": "cpu_time",
+    "samples": "sample_count",
+    "CPU model": "cpu_model",
+    "CPU cores": "cpu_count",
+    "calibration score": "calibration_score",
+}
+# STATS_COLUMNS that hold numerical data, and so are coerced to numbers when read.
+NUMERIC_STATS_COLUMNS = [
+    "peak RSS (MB)",
+    "CPU time (s)",
+    "samples",
+    "CPU cores",
+    "calibration score",
+]
 
 
 def read_profiling_json(json_in: Path) -> Tuple[datetime, float]:
@@ -36,7 +63,7 @@ def read_profiling_json(json_in: Path) -> Tuple[datetime, float]:
     return start_time, session_length_secs
 
 
-def read_additional_stats(stats_file: Path) -> None:
+def read_additional_stats(stats_file: Path) -> Tuple[Any, ...]:
     """
     Read the provided file, which is assumed to be a file containing additional statistics
     about the profiling run that cannot be conveyed by the pyis session file.
@@ -46,5 +73,61 @@ def read_additional_stats(stats_file: Path) -> None:
     Values are returned in the order that the STATS_COLUMNS variable gives their names.
 
     If values cannot be found, defaults (usually None to flag missing data) are assigned.
+    Values that are not scalars, or that cannot be read as numbers for the
+    NUMERIC_STATS_COLUMNS, are also treated as missing.
+    """
+    missing_stats = (None,) * len(STATS_COLUMNS)
+
+    with open(stats_file, "r") as json_file:
+        try:
+            stats_data = json.load(json_file)
+        except json.JSONDecodeError:
+            print(f"Skipping {stats_file}: stats file is not valid json")
+            return missing_stats
+    if not isinstance(stats_data, dict):
+        print(f"Skipping {stats_file}: stats file does not contain a json object")
+        return missing_stats
+
+    stats = []
+    for col in STATS_COLUMNS:
+        key = STATS_JSON_KEYS[col]
+        value = stats_data.get(key, None)
+        if value is None:
+            stats.append(None)
+            continue
+
+        if col in NUMERIC_STATS_COLUMNS:
+            checked_value = _as_number(value)
+        elif isinstance(value, (str, int, float)) and not isinstance(value, bool):
+            checked_value = value
+        else:
+            checked_value = None
+
+        if checked_value is None:
+            print(f"Skipping {key} in {stats_file}: cannot interpret value {value!r}")
+        stats.append(checked_value)
+    return tuple(stats)
+
+
+def _as_number(value: Any) -> int | float | None:
+    """
+    Interpret the value provided as a (finite) number, returning None if this
+    is not possible.
+
+    Numerical strings are converted to numbers, with integers preserved where possible.
     """
-    return
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        try:
+            value = int(value)
+        except ValueError:
+            try:
+                value = float(value)
+            except ValueError:
+                return None
+    if not isinstance(value, (int, float)):
+        return None
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
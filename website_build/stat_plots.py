@@ -7,6 +7,84 @@ import pandas as pd
 
 from utils import write_md_image
 
+DERIVED_COLUMNS = [
+    "CPU efficiency",
+    "normalised duration (s)",
+]
+# Columns of the run statistics table, and the format used to display floats in each.
+# Columns that do not hold floats are given an empty format.
+RUN_STATS_TABLE_COLUMNS = {
+    "Start Time": "",
+    "Commit": "",
+    "duration (s)": ".2f",
+    "normalised duration (s)": ".2f",
+    "CPU time (s)": ".2f",
+    "CPU efficiency": ".3f",
+    "peak RSS (MB)": ".2f",
+    "samples": "",
+    "CPU model": "",
+    "CPU cores": "",
+    "calibration score": ".3f",
+}
+
+
+def compute_derived_stats(data: pd.DataFrame) -> None:
+    """
+    Populate the DERIVED_COLUMNS of the provided DataFrame, using the statistics
+    read from the pyis sessions and their stats files.
+
+    CPU efficiency is the ratio of CPU time to wall-clock time of the profiling run.
+    The normalised duration is the wall-clock time scaled by the calibration score of
+    the runner, giving the time the run would be expected to take on the reference machine.
+
+    Rows where the required statistics are missing, or where the recorded duration
+    is not positive, are assigned NaN.
+    """
+    duration = pd.to_numeric(data["duration (s)"], errors="coerce")
+    duration = duration.where(duration > 0)
+    cpu_time = pd.to_numeric(data["CPU time (s)"], errors="coerce")
+    calibration = pd.to_numeric(data["calibration score"], errors="coerce")
+
+    data["CPU efficiency"] = cpu_time / duration
+    data["normalised duration (s)"] = duration * calibration
+    return
+
+
+def _plot_time_series(
+    data: pd.DataFrame,
+    columns: List[str],
+    output_file: Path,
+    ylabel: str,
+    title: str,
+) -> None:
+    """
+    Plot the given columns of the DataFrame against the run start time,
+    and save the figure to the output file.
+    """
+    fig, ax = plt.subplots(figsize=(12, 12))
+    for column in columns:
+        ax.plot(
+            data["Start Time"],
+            pd.to_numeric(data[column], errors="coerce"),
+            marker="o",
+            label=column,
+        )
+    ax.set_xlabel("Run triggered on")
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(output_file, bbox_inches=None)
+    plt.close(fig)
+    return
+
+
+def _has_data(data: pd.DataFrame, column: str) -> bool:
+    """
+    Return True if the column of the DataFrame contains at least one numeric value.
+    """
+    return pd.to_numeric(data[column], errors="coerce").notna().any()
+
 
 def make_stats_plots(data: pd.DataFrame, plot_output_dir: Path) -> Dict[str, Path]:
     """
@@ -14,12 +92,14 @@ def make_stats_plots(data: pd.DataFrame, plot_output_dir: Path) -> Dict[str, Pat
     information to the output directory.
 
     The DataFrame provided is intended to be the "site df" managed by the WebsiteBuilder.
+    Plots of the additional run statistics are only created if at least one run
+    recorded the statistics in question.
 
     Return a dictionary whose keys are the names of the plots, and whose values are
     the paths to the images of those plots.
     """
     # The plots that will be created
-    plot_dict = {"CPU Time": plot_output_dir / "runtime_figure.svg"}
+    plot_dict = {"Wall Time": plot_output_dir / "runtime_figure.svg"}
 
     # Create output directory if it doesn't exist
     if not os.path.exists(plot_output_dir):
@@ -30,11 +110,46 @@ def make_stats_plots(data: pd.DataFrame, plot_output_dir: Path) -> Dict[str, Pat
     data.plot(x="Start Time", y="duration (s)", ax=runtime_ax)
     runtime_ax.set_xlabel("Run triggered on")
     runtime_ax.set_ylabel("Runtime (s)")
-    runtime_ax.set_title("Profiling script CPU runtime")
+    runtime_ax.set_title("Profiling script wall-clock runtime")
     runtime_fig.tight_layout()
-    runtime_fig.savefig(plot_dict["CPU Time"], bbox_inches=None)
+    runtime_fig.savefig(plot_dict["Wall Time"], bbox_inches=None)
+    plt.close(runtime_fig)
+
+    # Runtime normalised by the speed of the runner the profiling was done on
+    if _has_data(data, "normalised duration (s)"):
+        plot_dict["Runner-Normalised Wall Time"] = (
+            plot_output_dir / "normalised_runtime_figure.svg"
+        )
+        _plot_time_series(
+            data,
+            ["duration (s)", "normalised duration (s)"],
+            plot_dict["Runner-Normalised Wall Time"],
+            "Runtime (s)",
+            "Profiling script runtime, normalised by runner calibration score",
+        )
+
+    # CPU time against wall-clock time
+    if _has_data(data, "CPU efficiency"):
+        plot_dict["CPU Efficiency"] = plot_output_dir / "cpu_efficiency_figure.svg"
+        _plot_time_series(
+            data,
+            ["CPU efficiency"],
+            plot_dict["CPU Efficiency"],
+            "CPU time / wall-clock time",
+            "Profiling script CPU efficiency",
+        )
+
+    # Peak memory usage
+    if _has_data(data, "peak RSS (MB)"):
+        plot_dict["Peak Memory"] = plot_output_dir / "peak_memory_figure.svg"
+        _plot_time_series(
+            data,
+            ["peak RSS (MB)"],
+            plot_dict["Peak Memory"],
+            "Peak resident set size (MB)",
+            "Profiling script peak memory usage",
+        )
 
-    # Create any other plots you might want
     return plot_dict
 
 
@@ -50,3 +165,19 @@ def markdown_for_run_plots(plot_dict: Dict[str, Path], build_dir: Path) -> List[
         markdown_string += write_md_image(location, build_dir, plot_name)
 
     return markdown_string
+
+
+def markdown_for_run_stats_table(data: pd.DataFrame) -> str:
+    """
+    Write the markdown source for a table of the statistics recorded
+    for each profiling session.
+
+    Missing statistics are left blank in the table.
+    """
+    table = data[list(RUN_STATS_TABLE_COLUMNS)].astype(object)
+    table = table.where(table.notna(), None)
+    return table.to_markdown(
+        index=False,
+        floatfmt=list(RUN_STATS_TABLE_COLUMNS.values()),
+        missingval="",
+    )